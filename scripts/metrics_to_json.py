@@ -16,250 +16,668 @@ Usage:
     
     # Continuously monitor a log file
     python3 metrics_to_json.py --input overlay_log.txt --output metrics.json --watch
+    
+    # Write JSON Lines (one object per line) instead of a JSON array
+    python3 metrics_to_json.py --input overlay_log.txt --output metrics.jsonl --watch --jsonl
 """
 
 import re
 import json
+import mmap
+import os
+import stat
 import argparse
+import functools
+import itertools
 import sys
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
 
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # google-re2 guarantees linear-time matching, which matters for the block
+    # anchor scan over multi-MB log files. Its API mirrors the re module, but
+    # it is only used on bytes: for str input every search() re-encodes the
+    # whole text to UTF-8, which is quadratic with one search per block.
+    import re2 as _block_re
+except ImportError:
+    _block_re = re
+
+
+def _dumps(obj, pretty: bool = False) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON, using orjson's C serializer when available.
+    
+    The json fallback is configured to produce the same bytes as orjson:
+    compact separators without spaces and non-ASCII text written as UTF-8.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
 
-def parse_metrics(text: str, log_timestamp: str = None) -> dict:
+# Every overlay line is "<prefix>: <values>" with a unique literal prefix, so
+# lines are dispatched on the text before the first ':' with a dict lookup and
+# the numbers are pulled out with plain string slicing/splitting.
+
+def _number(token: str, ctor=float):
+    """
+    Convert a plain decimal token ([0-9.]+ for float, [0-9]+ for int).
+    
+    float() and int() on their own also accept things like "nan", "inf",
+    "1e5", "1_0" or a sign, none of which the overlay ever prints.
+    """
+    allowed = "0123456789." if ctor is float else "0123456789"
+    if not token or token.strip(allowed):
+        raise ValueError(f"not a plain number: {token!r}")
+    return ctor(token)
+
+
+# Lines holding a single number: prefix -> (section, type, key)
+_SIMPLE_FIELDS = {
+    # Incoming frame rate from network: X.XX FPS
+    "Incoming frame rate from network": ("frame_rates", float, "incoming_network_fps"),
+    # Decoding frame rate: X.XX FPS
+    "Decoding frame rate": ("frame_rates", float, "decoding_fps"),
+    # Rendering frame rate: X.XX FPS
+    "Rendering frame rate": ("frame_rates", float, "rendering_fps"),
+    # Frames dropped by your network connection: X.XX%
+    "Frames dropped by your network connection": ("network", float, "frames_dropped_percent"),
+    # Frames dropped due to network jitter: X.XX%
+    "Frames dropped due to network jitter": ("network", float, "jitter_dropped_percent"),
+    # Average decoding time: X.XX ms
+    "Average decoding time": ("timing", float, "average_decode_time_ms"),
+    # Average frame queue delay: X.XX ms
+    "Average frame queue delay": ("timing", float, "average_queue_delay_ms"),
+    # Average rendering time (including monitor V-sync latency): X.XX ms
+    "Average rendering time (including monitor V-sync latency)": ("timing", float, "average_render_time_ms"),
+    "Average rendering time": ("timing", float, "average_render_time_ms"),
+}
+
+
+def _parse_video(value: str, metrics: dict):
+    # Video stream: WIDTHxHEIGHT FPS (Codec: CODEC)
+    resolution, fps, _, codec = value.split(None, 3)
+    if not codec.startswith("(Codec:") or not codec.endswith(")"):
+        raise ValueError(f"malformed codec: {codec!r}")
+    width, height = resolution.split('x')
+    # Convert everything before touching metrics so a malformed line
+    # doesn't leave an empty section behind
+    video_stream = {
+        "width": _number(width, int),
+        "height": _number(height, int),
+        "fps": _number(fps),
+        "codec": codec[len("(Codec:"):-1].strip()
+    }
+    metrics.setdefault("video_stream", {}).update(video_stream)
+
+
+def _parse_bitrate(value: str, metrics: dict):
+    # Bitrate: X.X Mbps, Peak (Ys): Y.Y (if DISPLAY_BITRATE is defined)
+    current, _, peak = value.partition(',')
+    window, _, peak_value = peak.partition('):')
+    bitrate = {
+        "bitrate_mbps": _number(current.split()[0]),
+        "peak_window_seconds": _number(window.partition('(')[2].rstrip('s'), int),
+        "peak_bitrate_mbps": _number(peak_value.split()[0])
+    }
+    metrics.setdefault("video_stream", {}).update(bitrate)
+
+
+def _parse_latency(value: str, metrics: dict):
+    # Host processing latency min/max/average: X.X/X.X/X.X ms
+    min_ms, max_ms, average_ms = value.split()[0].split('/')
+    metrics["host_processing_latency"] = {
+        "min_ms": _number(min_ms),
+        "max_ms": _number(max_ms),
+        "average_ms": _number(average_ms)
+    }
+
+
+def _parse_rtt(value: str, metrics: dict):
+    # Average network latency: X ms (variance: Y ms) or N/A
+    latency, _, variance = value.partition('(variance:')
+    latency = latency.split()[0]
+    if latency == "N/A":
+        metrics.setdefault("network", {}).update({
+            "rtt_ms": None,
+            "rtt_variance_ms": None
+        })
+        return
+    rtt = {
+        "rtt_ms": _number(latency, int),
+        "rtt_variance_ms": _number(variance.split()[0], int)
+    }
+    metrics.setdefault("network", {}).update(rtt)
+
+
+# Lines holding several values: prefix -> parser(value, metrics)
+_LINE_PARSERS = {
+    "Video stream": _parse_video,
+    "Bitrate": _parse_bitrate,
+    "Host processing latency min/max/average": _parse_latency,
+    "Average network latency": _parse_rtt,
+}
+
+
+# Memoized ISO timestamps keyed on the "<date>T<HH:MM:SS>" string. The overlay
+# prints several blocks per second, so consecutive blocks usually hit the cache.
+_TS_CACHE: dict = {}
+_TS_CACHE_MAX_SIZE = 4096
+
+# Log block anchors used by extract_metrics_blocks(). Blocks are located by
+# their anchors and sliced out of the text in between, which keeps extraction
+# a single linear scan with no DOTALL lookaheads to backtrack through.
+# Format: "HH:MM:SS - SDL Info (0): [METRICS] Video stream: ..."
+_TIMESTAMPED_ANCHOR_RE = re.compile(r'(\d{2}:\d{2}:\d{2})\s*-\s*SDL\s+Info\s*\(\d+\):\s*\[METRICS\]\s*')
+_UNTIMESTAMPED_ANCHOR_RE = re.compile(r'\[METRICS\]\s*')
+_RAW_ANCHOR_RE = re.compile(r'Video stream:')
+
+# Start of any line that ends a timestamped block
+_BLOCK_BOUNDARY_RE = re.compile(r'(?m)^\d{2}:\d{2}:\d{2}\s*-\s*SDL\s+Info')
+
+# Bytes variants of the block patterns, used to scan memory-mapped log files
+# without decoding them (with re2 when available). The pattern alphabet is
+# plain ASCII.
+_TIMESTAMPED_ANCHOR_BYTES_RE = _block_re.compile(_TIMESTAMPED_ANCHOR_RE.pattern.encode())
+_UNTIMESTAMPED_ANCHOR_BYTES_RE = _block_re.compile(_UNTIMESTAMPED_ANCHOR_RE.pattern.encode())
+_RAW_ANCHOR_BYTES_RE = _block_re.compile(_RAW_ANCHOR_RE.pattern.encode())
+_BLOCK_BOUNDARY_BYTES_RE = _block_re.compile(_BLOCK_BOUNDARY_RE.pattern.encode())
+
+
+def _resolve_timestamp(log_timestamp: str = None, today: date = None) -> str:
+    """Return the ISO timestamp for a block logged at log_timestamp (HH:MM:SS)."""
+    # Use log timestamp if provided, otherwise use current time
+    if log_timestamp:
+        # Combine log time (HH:MM:SS) with today's date. fromisoformat() is
+        # implemented in C, so build the ISO string and let it validate.
+        if today is None:
+            today = datetime.now().date()
+        iso_string = f"{today.isoformat()}T{log_timestamp}"
+        timestamp = _TS_CACHE.get(iso_string)
+        if timestamp is None:
+            try:
+                timestamp = datetime.fromisoformat(iso_string).isoformat()
+                if len(_TS_CACHE) >= _TS_CACHE_MAX_SIZE:
+                    _TS_CACHE.clear()
+                _TS_CACHE[iso_string] = timestamp
+            except ValueError:
+                timestamp = datetime.now().isoformat()
+    else:
+        timestamp = datetime.now().isoformat()
+    return timestamp
+
+
+def parse_metrics(text: str, log_timestamp: str = None, *, today: date = None) -> dict:
     """
     Parse Moonlight overlay metrics text into a structured dictionary.
     
     Args:
         text: The overlay text containing metrics
         log_timestamp: Optional timestamp string from log (HH:MM:SS format)
+        today: Date to combine with log_timestamp (default: today's date).
+            Callers parsing many blocks should pass this once per batch.
         
     Returns:
         Dictionary with parsed metrics
     """
-    # Use log timestamp if provided, otherwise use current time
-    if log_timestamp:
-        # Combine log time (HH:MM:SS) with today's date
-        today = datetime.now().date()
+    timestamp = _resolve_timestamp(log_timestamp, today)
+    
+    # Sections are created on first write, so empty ones never appear
+    metrics = {"timestamp": timestamp}
+    # Only the first well-formed occurrence of each line counts
+    parsed_prefixes = set()
+    
+    for line in text.splitlines():
+        prefix, _, value = line.strip().partition(':')
+        if prefix in parsed_prefixes:
+            continue
         try:
-            time_parts = log_timestamp.split(':')
-            timestamp = datetime(
-                today.year, today.month, today.day,
-                int(time_parts[0]), int(time_parts[1]), int(time_parts[2])
-            ).isoformat()
+            field = _SIMPLE_FIELDS.get(prefix)
+            if field is not None:
+                section, ctor, key = field
+                metrics.setdefault(section, {})[key] = _number(value.split(None, 1)[0].rstrip('%'), ctor)
+            else:
+                parser = _LINE_PARSERS.get(prefix)
+                if parser is None:
+                    continue
+                parser(value, metrics)
+            parsed_prefixes.add(prefix)
         except (ValueError, IndexError):
-            timestamp = datetime.now().isoformat()
-    else:
-        timestamp = datetime.now().isoformat()
+            # Skip malformed lines rather than failing the whole block
+            pass
     
-    metrics = {
-        "timestamp": timestamp,
-        "video_stream": {},
-        "frame_rates": {},
-        "host_processing_latency": {},
-        "network": {},
-        "timing": {}
-    }
+    return metrics
+
+
+def extract_metrics_blocks(text) -> list:
+    """
+    Extract metrics blocks from log output.
+    Handles [METRICS] prefixed log lines from Moonlight.
     
-    # Video stream: WIDTHxHEIGHT FPS (Codec: CODEC)
-    video_match = re.search(
-        r'Video stream:\s*(\d+)x(\d+)\s+([\d.]+)\s*FPS\s*\(Codec:\s*([^)]+)\)',
-        text
-    )
-    if video_match:
-        metrics["video_stream"] = {
-            "width": int(video_match.group(1)),
-            "height": int(video_match.group(2)),
-            "fps": float(video_match.group(3)),
-            "codec": video_match.group(4).strip()
-        }
+    Args:
+        text: Log text as str, or as bytes/mmap to scan the raw file contents
+            and only decode the metrics blocks that are found
     
-    # Bitrate: X.X Mbps, Peak (Ys): Y.Y (if DISPLAY_BITRATE is defined)
-    bitrate_match = re.search(
-        r'Bitrate:\s*([\d.]+)\s*Mbps,\s*Peak\s*\((\d+)s\):\s*([\d.]+)',
-        text
-    )
-    if bitrate_match:
-        metrics["video_stream"]["bitrate_mbps"] = float(bitrate_match.group(1))
-        metrics["video_stream"]["peak_window_seconds"] = int(bitrate_match.group(2))
-        metrics["video_stream"]["peak_bitrate_mbps"] = float(bitrate_match.group(3))
+    Returns:
+        List of tuples: (timestamp, metrics_text)
+        timestamp is HH:MM:SS string or None if not found
+    """
+    if isinstance(text, str):
+        timestamped_re = _TIMESTAMPED_ANCHOR_RE
+        untimestamped_re = _UNTIMESTAMPED_ANCHOR_RE
+        raw_re = _RAW_ANCHOR_RE
+        boundary_re = _BLOCK_BOUNDARY_RE
+    else:
+        timestamped_re = _TIMESTAMPED_ANCHOR_BYTES_RE
+        untimestamped_re = _UNTIMESTAMPED_ANCHOR_BYTES_RE
+        raw_re = _RAW_ANCHOR_BYTES_RE
+        boundary_re = _BLOCK_BOUNDARY_BYTES_RE
     
-    # Incoming frame rate from network: X.XX FPS
-    incoming_fps_match = re.search(
-        r'Incoming frame rate from network:\s*([\d.]+)\s*FPS',
-        text
-    )
-    if incoming_fps_match:
-        metrics["frame_rates"]["incoming_network_fps"] = float(incoming_fps_match.group(1))
+    blocks = []
     
-    # Decoding frame rate: X.XX FPS
-    decoding_fps_match = re.search(
-        r'Decoding frame rate:\s*([\d.]+)\s*FPS',
-        text
-    )
-    if decoding_fps_match:
-        metrics["frame_rates"]["decoding_fps"] = float(decoding_fps_match.group(1))
+    # Look for [METRICS] tagged entries with timestamp prefix. Each block runs
+    # to the next SDL Info line, which is at the latest the next anchor.
+    for match in timestamped_re.finditer(text):
+        boundary = boundary_re.search(text, match.end())
+        end = boundary.start() if boundary else len(text)
+        content = text[match.end():end].strip()
+        if content:
+            blocks.append((match.group(1), content))
     
-    # Rendering frame rate: X.XX FPS
-    rendering_fps_match = re.search(
-        r'Rendering frame rate:\s*([\d.]+)\s*FPS',
-        text
-    )
-    if rendering_fps_match:
-        metrics["frame_rates"]["rendering_fps"] = float(rendering_fps_match.group(1))
+    # Fallback: Look for [METRICS] without timestamp
+    if not blocks:
+        matches = list(untimestamped_re.finditer(text))
+        for match, next_match in zip(matches, matches[1:] + [None]):
+            end = next_match.start() if next_match else len(text)
+            content = text[match.end():end].strip()
+            if content:
+                blocks.append((None, content))
     
-    # Host processing latency min/max/average: X.X/X.X/X.X ms
-    latency_match = re.search(
-        r'Host processing latency min/max/average:\s*([\d.]+)/([\d.]+)/([\d.]+)\s*ms',
-        text
-    )
-    if latency_match:
-        metrics["host_processing_latency"] = {
-            "min_ms": float(latency_match.group(1)),
-            "max_ms": float(latency_match.group(2)),
-            "average_ms": float(latency_match.group(3))
-        }
+    # Fallback: raw metrics blocks (Video stream: ... pattern)
+    if not blocks:
+        matches = list(raw_re.finditer(text))
+        for match, next_match in zip(matches, matches[1:] + [None]):
+            end = next_match.start() if next_match else len(text)
+            content = text[match.start():end].strip()
+            if content:
+                blocks.append((None, content))
     
-    # Frames dropped by your network connection: X.XX%
-    network_dropped_match = re.search(
-        r'Frames dropped by your network connection:\s*([\d.]+)%',
-        text
-    )
-    if network_dropped_match:
-        metrics["network"]["frames_dropped_percent"] = float(network_dropped_match.group(1))
+    if not isinstance(text, str):
+        blocks = [
+            (ts.decode('ascii') if ts is not None else None, content.decode('utf-8', 'replace'))
+            for ts, content in blocks
+        ]
     
-    # Frames dropped due to network jitter: X.XX%
-    jitter_dropped_match = re.search(
-        r'Frames dropped due to network jitter:\s*([\d.]+)%',
-        text
-    )
-    if jitter_dropped_match:
-        metrics["network"]["jitter_dropped_percent"] = float(jitter_dropped_match.group(1))
+    return blocks
+
+
+# Number of parsed entries serialized per write in one-shot mode
+_WRITE_BATCH_SIZE = 256
+
+
+def _has_stream_metrics(block: str) -> bool:
+    """
+    Cheap pre-check for whether a block can yield video stream or frame rate
+    data, so blocks that would be discarded anyway are never parsed.
+    """
+    return "Video stream:" in block or "frame rate" in block or "Bitrate:" in block
+
+
+# Minimum batch size for parsing in worker processes. Serial parsing takes
+# about 15 us per block, so 2048 blocks is ~30 ms of work, against ~8 ms to
+# start a pool; smaller batches can't gain more than a few milliseconds.
+_PARALLEL_MIN_BLOCKS = 2048
+
+
+def _parse_block(item: tuple, today: date = None) -> dict:
+    log_timestamp, block = item
+    return parse_metrics(block, log_timestamp, today=today)
+
+
+def _parse_blocks(blocks: list, today: date = None):
+    """
+    Parse extracted (timestamp, text) blocks into metrics entries.
     
-    # Average network latency: X ms (variance: Y ms) or N/A
-    rtt_match = re.search(
-        r'Average network latency:\s*(\d+)\s*ms\s*\(variance:\s*(\d+)\s*ms\)',
-        text
-    )
-    if rtt_match:
-        metrics["network"]["rtt_ms"] = int(rtt_match.group(1))
-        metrics["network"]["rtt_variance_ms"] = int(rtt_match.group(2))
+    Large batches are parsed in worker processes; blocks are independent and
+    parsing them is pure-Python work bound by the GIL. Entries are yielded in
+    log order, and only those with video stream or frame rate data are kept.
+    """
+    blocks = [item for item in blocks if _has_stream_metrics(item[1])]
+    parse = functools.partial(_parse_block, today=today)
+    # With a single CPU the workers only add pickling and IPC overhead
+    if len(blocks) >= _PARALLEL_MIN_BLOCKS and (os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor() as executor:
+            for metrics in executor.map(parse, blocks, chunksize=64):
+                if metrics.get("video_stream") or metrics.get("frame_rates"):
+                    yield metrics
     else:
-        na_match = re.search(r'Average network latency:\s*N/A', text)
-        if na_match:
-            metrics["network"]["rtt_ms"] = None
-            metrics["network"]["rtt_variance_ms"] = None
+        for metrics in map(parse, blocks):
+            if metrics.get("video_stream") or metrics.get("frame_rates"):
+                yield metrics
+
+
+def _extract_file_blocks(path: Path) -> tuple:
+    """
+    Extract metrics blocks from a log file by scanning a memory map of it.
+    Anything that isn't a regular file, or can't be mapped, is read instead.
     
-    # Average decoding time: X.XX ms
-    decode_time_match = re.search(
-        r'Average decoding time:\s*([\d.]+)\s*ms',
-        text
-    )
-    if decode_time_match:
-        metrics["timing"]["average_decode_time_ms"] = float(decode_time_match.group(1))
+    Returns:
+        Tuple of (blocks, text). text is the decoded file contents, but is
+        only read when no blocks were found (for the single-block fallback)
+    """
+    with open(path, 'rb') as fh:
+        st = os.fstat(fh.fileno())
+        # Pipes, FIFOs and devices also report size 0 and can't be mapped;
+        # only regular files go through mmap
+        if stat.S_ISREG(st.st_mode):
+            if st.st_size == 0:
+                return [], ""
+            try:
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    blocks = extract_metrics_blocks(mm)
+                    text = "" if blocks else mm[:].decode('utf-8', 'replace')
+                return blocks, text
+            except (OSError, ValueError):
+                pass
+        text = fh.read().decode('utf-8', 'replace')
+    return extract_metrics_blocks(text), text
+
+
+class _LogTailer:
+    """
+    Incrementally read a growing log file.
     
-    # Average frame queue delay: X.XX ms
-    queue_delay_match = re.search(
-        r'Average frame queue delay:\s*([\d.]+)\s*ms',
-        text
-    )
-    if queue_delay_match:
-        metrics["timing"]["average_queue_delay_ms"] = float(queue_delay_match.group(1))
+    The file is kept open between reads instead of being reopened on every
+    poll. A [METRICS] block that may still be receiving lines is held back
+    until the next block boundary arrives, so a block split across two reads
+    isn't lost; otherwise only an incomplete last line is held back.
+    """
     
-    # Average rendering time (including monitor V-sync latency): X.XX ms
-    render_time_match = re.search(
-        r'Average rendering time.*?:\s*([\d.]+)\s*ms',
-        text
-    )
-    if render_time_match:
-        metrics["timing"]["average_render_time_ms"] = float(render_time_match.group(1))
+    # Held-back text beyond this size is handed over even if the block it
+    # starts with hasn't seen a boundary yet; real blocks are under 1 KB
+    MAX_PENDING = 1 << 20
     
-    # Remove empty sub-dictionaries
-    metrics = {k: v for k, v in metrics.items() if v}
+    def __init__(self, path: Path):
+        self.path = path
+        self._fh = None
+        self._inode = None
+        self._pending = ""
+        # Whether _pending starts with a [METRICS] block that may be incomplete
+        self._holding_block = False
     
-    return metrics
+    def _open(self):
+        try:
+            self._fh = open(self.path, 'r', buffering=1 << 16)
+        except FileNotFoundError:
+            self._fh = None
+            return
+        self._inode = os.fstat(self._fh.fileno()).st_ino
+    
+    def _rotated(self) -> bool:
+        """Return whether the file was removed, replaced or truncated."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return True
+        return st.st_ino != self._inode or st.st_size < self._fh.tell()
+    
+    def read_complete(self) -> str:
+        """
+        Read any new log content.
+        
+        Returns:
+            Text up to (not including) the last block boundary seen so far,
+            or an empty string if no complete block is available yet
+        """
+        previous = ""
+        if self._fh is not None and self._rotated():
+            self.close()
+            # Nothing will follow the old file's held-back last block, so it
+            # is complete; hand it over ahead of the new file's content
+            previous = self.flush()
+            if previous and not previous.endswith('\n'):
+                previous += '\n'
+        if self._fh is None:
+            self._open()
+            if self._fh is None:
+                return previous
+        
+        new_content = self._fh.read()
+        if not new_content:
+            return previous
+        
+        # Only the new text (plus the old last line, which may have been
+        # incomplete) needs scanning for boundaries
+        old_length = len(self._pending)
+        self._pending += new_content
+        scan_from = self._pending.rfind('\n', 0, old_length) + 1
+        
+        boundary = None
+        for boundary in _BLOCK_BOUNDARY_RE.finditer(self._pending, scan_from):
+            pass
+        if boundary is not None:
+            self._holding_block = _TIMESTAMPED_ANCHOR_RE.match(self._pending, boundary.start()) is not None
+        
+        if self._holding_block and len(self._pending) <= self.MAX_PENDING:
+            # The last boundary opens a [METRICS] block; keep it until the next one
+            cut = boundary.start() if boundary is not None else 0
+        else:
+            # No block can still be open; hand over every complete line
+            self._holding_block = False
+            cut = self._pending.rfind('\n') + 1
+        
+        complete, self._pending = self._pending[:cut], self._pending[cut:]
+        return previous + complete
+    
+    def flush(self) -> str:
+        """Return and clear whatever text is still being held back."""
+        remaining, self._pending = self._pending, ""
+        self._holding_block = False
+        return remaining
+    
+    def close(self):
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
 
 
-def extract_metrics_blocks(text: str) -> list:
+class _MetricsWriter:
     """
-    Extract metrics blocks from log output.
-    Handles [METRICS] prefixed log lines from Moonlight.
+    Append metrics entries to the output file without rewriting it.
     
-    Returns:
-        List of tuples: (timestamp, metrics_text)
-        timestamp is HH:MM:SS string or None if not found
+    In JSON Lines mode each entry is written as one line. Otherwise the file
+    is kept a valid JSON array: new entries overwrite the closing bracket and
+    then re-terminate the array.
     """
-    blocks = []
     
-    # Look for [METRICS] tagged entries with timestamp prefix
-    # Format: "HH:MM:SS - SDL Info (0): [METRICS] Video stream: ..."
-    metrics_pattern = re.compile(
-        r'(\d{2}:\d{2}:\d{2})\s*-\s*SDL\s+Info\s*\(\d+\):\s*\[METRICS\]\s*(.*?)(?=\d{2}:\d{2}:\d{2}\s*-\s*SDL\s+Info.*?\[METRICS\]|$)',
-        re.DOTALL
-    )
-    matches = metrics_pattern.findall(text)
-    if matches:
-        blocks.extend([(ts, content.strip()) for ts, content in matches if content.strip()])
+    def __init__(self, path: Path, jsonl: bool = False, pretty: bool = True):
+        self._fh = open(path, 'wb')
+        self._jsonl = jsonl
+        self._pretty = pretty
+        # Offset just past the last entry, i.e. where the closing bracket starts
+        self._tail_offset = None
+        if not jsonl:
+            self._fh.write(b"[]")
+            self._fh.flush()
     
-    # Fallback: Look for [METRICS] without timestamp
-    if not blocks:
-        simple_pattern = re.compile(r'\[METRICS\]\s*(.*?)(?=\[METRICS\]|$)', re.DOTALL)
-        matches = simple_pattern.findall(text)
-        if matches:
-            blocks.extend([(None, m.strip()) for m in matches if m.strip()])
+    def write(self, entries: list):
+        if not entries:
+            return
+        if self._jsonl:
+            self._fh.write(b"".join(_dumps(m) + b"\n" for m in entries))
+        else:
+            if self._pretty:
+                # Indent each pretty-printed entry one level to nest it in the array
+                start, separator, end = b"[\n", b",\n", b"\n]"
+                body = separator.join(b"  " + _dumps(m, pretty=True).replace(b"\n", b"\n  ") for m in entries)
+            else:
+                start, separator, end = b"[", b",", b"]"
+                body = separator.join(_dumps(m) for m in entries)
+            if self._tail_offset is None:
+                self._fh.seek(0)
+                body = start + body
+            else:
+                self._fh.seek(self._tail_offset)
+                body = separator + body
+            self._fh.write(body)
+            self._tail_offset = self._fh.tell()
+            self._fh.write(end)
+        self._fh.flush()
     
-    # Fallback: raw metrics blocks (Video stream: ... pattern)
-    if not blocks:
-        raw_pattern = re.compile(r'(Video stream:.*?)(?=Video stream:|$)', re.DOTALL)
-        matches = raw_pattern.findall(text)
-        blocks.extend([(None, m.strip()) for m in matches if m.strip()])
+    def close(self):
+        self._fh.close()
+
+
+def _watch_for_changes(path: Path, changed: threading.Event):
+    """
+    Set an event whenever the file at path is created, modified or moved.
     
-    return blocks
+    Returns:
+        The running watchdog Observer, or None if watchdog isn't installed
+        or the file's directory can't be watched
+    """
+    if Observer is None:
+        return None
+    
+    target = path.resolve()
+    
+    class ChangeHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            paths = [event.src_path, getattr(event, "dest_path", "")]
+            if any(p and Path(os.fsdecode(p)).resolve() == target for p in paths):
+                changed.set()
+    
+    observer = Observer()
+    try:
+        observer.schedule(ChangeHandler(), str(target.parent), recursive=False)
+        observer.start()
+    except OSError:
+        return None
+    return observer
 
 
-def read_and_parse_continuous(input_path: Path, output_path: Path, interval: float = 1.0):
+def read_and_parse_continuous(input_path: Path, output_path: Path, interval: float = 1.0,
+                              jsonl: bool = False, collapse_duplicates: bool = False):
     """
     Continuously monitor a log file and update JSON output.
     
     Args:
         input_path: Path to the input log file
         output_path: Path to the output JSON file
-        interval: Seconds between reads
+        interval: Seconds between reads when polling (used only if watchdog
+            isn't available for file change notifications)
+        jsonl: Write one JSON object per line instead of a JSON array
+        collapse_duplicates: Write a block identical to the previous one as
+            {"timestamp", "duplicate_of"} instead of repeating its metrics
     """
-    all_metrics = []
-    last_position = 0
+    total_entries = 0
+    duplicate_entries = 0
+    # The last block's text and the entry parsed from it (None if it was
+    # rejected). The overlay often repeats unchanged text while idle.
+    last_block = None
+    last_metrics = None
+    tailer = _LogTailer(input_path)
+    writer = _MetricsWriter(output_path, jsonl)
+    
+    def process(new_content: str):
+        nonlocal total_entries, duplicate_entries, last_block, last_metrics
+        
+        # Extract metrics blocks from log content
+        blocks = extract_metrics_blocks(new_content)
+        today = datetime.now().date()
+        new_metrics = []
+        status_lines = []
+        for log_timestamp, block in blocks:
+            if not _has_stream_metrics(block):
+                continue
+            
+            if block == last_block:
+                # Same text as the previous block, so skip parsing it again
+                if last_metrics is None:
+                    continue
+                duplicate_entries += 1
+                timestamp = _resolve_timestamp(log_timestamp, today)
+                if collapse_duplicates:
+                    metrics = {"timestamp": timestamp, "duplicate_of": last_metrics["timestamp"]}
+                else:
+                    metrics = dict(last_metrics, timestamp=timestamp)
+            else:
+                last_block = block
+                metrics = parse_metrics(block, log_timestamp, today=today)
+                if not (metrics.get("video_stream") or metrics.get("frame_rates")):
+                    last_metrics = None
+                    continue
+                last_metrics = metrics
+                timestamp = metrics["timestamp"]
+            
+            new_metrics.append(metrics)
+            status_lines.append(f"[{timestamp}] Captured metrics entry")
+        
+        # Append only the new entries to the output
+        writer.write(new_metrics)
+        total_entries += len(new_metrics)
+        
+        # Report the whole batch with a single write instead of a print per entry
+        if status_lines:
+            sys.stdout.write("\n".join(status_lines) + "\n")
+            sys.stdout.flush()
+    
+    def read_new_content():
+        new_content = tailer.read_complete()
+        if new_content.strip():
+            process(new_content)
+    
+    # Prefer change notifications over polling when watchdog is available
+    changed = threading.Event()
+    observer = _watch_for_changes(input_path, changed)
     
     print(f"Watching {input_path} for new metrics...")
     print(f"Writing to {output_path}")
     print("Press Ctrl+C to stop.\n")
     
     try:
-        while True:
-            if input_path.exists():
-                with open(input_path, 'r') as f:
-                    f.seek(last_position)
-                    new_content = f.read()
-                    last_position = f.tell()
-                    
-                    if new_content.strip():
-                        # Extract metrics blocks from log content
-                        blocks = extract_metrics_blocks(new_content)
-                        for log_timestamp, block in blocks:
-                            if block:
-                                metrics = parse_metrics(block, log_timestamp)
-                                if metrics.get("video_stream") or metrics.get("frame_rates"):
-                                    all_metrics.append(metrics)
-                                    print(f"[{metrics['timestamp']}] Captured metrics entry")
-                        
-                        # Write updated JSON
-                        with open(output_path, 'w') as out_f:
-                            json.dump(all_metrics, out_f, indent=2)
-            
-            time.sleep(interval)
+        if observer is not None:
+            read_new_content()
+            while True:
+                # The timeout only keeps Ctrl+C responsive on every platform
+                if changed.wait(1.0):
+                    changed.clear()
+                    read_new_content()
+        else:
+            while True:
+                read_new_content()
+                time.sleep(interval)
     except KeyboardInterrupt:
-        print(f"\n\nStopped. Total entries captured: {len(all_metrics)}")
+        # The last block has no following boundary; parse it on the way out
+        remaining = tailer.flush()
+        if remaining.strip():
+            process(remaining)
+        print(f"\n\nStopped. Total entries captured: {total_entries}")
+        if duplicate_entries:
+            print(f"Unchanged entries not re-parsed: {duplicate_entries}")
         print(f"Output saved to: {output_path}")
+    finally:
+        if observer is not None:
+            observer.stop()
+            observer.join()
+        tailer.close()
+        writer.close()
 
 
 def main():
@@ -294,7 +712,18 @@ def main():
         "--interval",
         type=float,
         default=1.0,
-        help="Watch interval in seconds (default: 1.0)"
+        help="Watch polling interval in seconds, used when watchdog isn't installed (default: 1.0)"
+    )
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Write JSON Lines (one metrics object per line) instead of a JSON array"
+    )
+    parser.add_argument(
+        "--collapse-duplicates",
+        action="store_true",
+        help="In watch mode, write blocks identical to the previous one as "
+             "{timestamp, duplicate_of} instead of repeating the metrics"
     )
     
     args = parser.parse_args()
@@ -303,37 +732,45 @@ def main():
         if not args.input:
             print("Error: --watch requires --input to be specified", file=sys.stderr)
             sys.exit(1)
-        read_and_parse_continuous(args.input, args.output, args.interval)
+        read_and_parse_continuous(args.input, args.output, args.interval, args.jsonl,
+                                  args.collapse_duplicates)
     else:
         # One-time parse
+        # Extract all metrics blocks with timestamps
         if args.input:
-            text = args.input.read_text()
+            blocks, text = _extract_file_blocks(args.input)
         else:
             text = sys.stdin.read()
-        
-        # Extract all metrics blocks with timestamps
-        blocks = extract_metrics_blocks(text)
+            blocks = extract_metrics_blocks(text)
         if blocks:
-            all_metrics = []
-            for log_timestamp, block in blocks:
-                if block:
-                    metrics = parse_metrics(block, log_timestamp)
-                    if metrics.get("video_stream") or metrics.get("frame_rates"):
-                        all_metrics.append(metrics)
-            
-            indent = 2 if args.pretty else None
-            output = json.dumps(all_metrics, indent=indent)
+            # Stream entries to the output in batches rather than collecting
+            # every parsed entry in memory before serializing
+            entries = _parse_blocks(blocks, today=datetime.now().date())
+            writer = _MetricsWriter(args.output, args.jsonl, args.pretty)
+            try:
+                while True:
+                    batch = list(itertools.islice(entries, _WRITE_BATCH_SIZE))
+                    if not batch:
+                        break
+                    writer.write(batch)
+            finally:
+                writer.close()
+            print(f"Metrics written to {args.output}")
+            return
+        
+        # Fallback: parse entire text as single block
+        metrics = parse_metrics(text)
+        if args.jsonl:
+            output = _dumps(metrics) + b"\n"
         else:
-            # Fallback: parse entire text as single block
-            metrics = parse_metrics(text)
-            indent = 2 if args.pretty else None
-            output = json.dumps(metrics, indent=indent)
+            output = _dumps(metrics, pretty=args.pretty)
         
         if args.output:
-            args.output.write_text(output)
+            args.output.write_bytes(output)
             print(f"Metrics written to {args.output}")
         else:
-            print(output)
+            sys.stdout.flush()
+            sys.stdout.buffer.write(output + b"\n")
 
 
 if __name__ == "__main__":